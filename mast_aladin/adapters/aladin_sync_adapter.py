@@ -1,19 +1,27 @@
-from IPython.display import display
 from mast_aladin.app import gca
 
 from .viewer_sync_adapter import ViewerSyncAdapter
 
+# traitlets which change when the aladin viewport is moved:
+_SYNC_TRAIT_NAMES = ("_target", "_fov", "_rotation")
+
 
 class AladinSyncAdapter(ViewerSyncAdapter):
     def __init__(self, viewer=None):
         self.viewer = viewer if viewer else gca()
         self.aid = self.viewer.aid
 
+    @property
+    def closed(self):
+        return self.viewer.comm is None
+
     def add_callback(self, func):
-        self.viewer.observe(func, names=["_target", "_fov", "_rotation"])
+        self.viewer.observe(func, names=_SYNC_TRAIT_NAMES)
 
     def remove_callback(self, func):
-        self.viewer.unobserve(func, names=["_target", "_fov", "_rotation"])
+        self.viewer.unobserve(func, names=_SYNC_TRAIT_NAMES)
 
     def show(self):
+        from IPython.display import display
+
         display(self.viewer)
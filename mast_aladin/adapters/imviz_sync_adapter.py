@@ -7,8 +7,13 @@ class ImvizSyncAdapter(ViewerSyncAdapter):
         from jdaviz.configs.imviz.helper import _current_app
         self.app = viewer if viewer else _current_app
         self.viewer = self.app.default_viewer
-        self.aid = self.viewer._obj.glue_viewer.aid
-        self.state = self.viewer._obj.glue_viewer.state
+        glue_viewer = self.viewer._obj.glue_viewer
+        self.aid = glue_viewer.aid
+        self.state = glue_viewer.state
+
+    @property
+    def closed(self):
+        return self.app.app.comm is None
 
     def add_callback(self, func):
         for name in ['x_min', 'reference_data']:
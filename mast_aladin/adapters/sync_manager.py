@@ -1,26 +1,88 @@
-from mast_aladin.aida import AIDA_aspects
+import asyncio
+import warnings
+
+from mast_aladin.aida import AIDA_aspects, VIEWPORT_SYNC_ASPECTS
 
 
 class SyncManager():
+    """
+    Keep a destination viewer in sync with a source viewer.
+
+    Attributes
+    ----------
+    _delay_ms : float
+        Time in milliseconds to wait after a change in the source viewer
+        before syncing the destination. Changes arriving within this window
+        (e.g. the center, fov and rotation updates fired by a single pan)
+        are coalesced into one sync using the latest source state. Set to
+        zero to sync on every change. Default is 40.
+    """
     ASPECTS = (AIDA_aspects.CENTER, AIDA_aspects.FOV, AIDA_aspects.ROTATION)
 
     def __init__(self):
         self.source = None
         self.destination = None
         self.aspects = self.ASPECTS
+        self._delay_ms = 40
+        self._pending = False
 
     def _callback(self, caller):
-        self.destination.sync_to(self.source, self.aspects)
+        # a sync is already scheduled, and will use the latest source state:
+        if self._pending:
+            return
+
+        if self._delay_ms <= 0:
+            return self._flush()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop to defer to (e.g. outside a kernel), sync now:
+            return self._flush()
+
+        self._pending = True
+        loop.call_later(self._delay_ms / 1000, self._flush)
+
+    def _flush(self):
+        self._pending = False
+
+        # real time sync may have been stopped while the flush was pending:
+        if self.source is None or self.destination is None:
+            return
+
+        # stop syncing, and release the callback, if either viewer is gone:
+        if self.source.closed or self.destination.closed:
+            self.stop_real_time_sync()
+            return
+
+        try:
+            # if the source is (still) where a sync put it, the change is an
+            # echo of a reverse sync (e.g. by another SyncManager from the
+            # destination to the source), so don't sync it back:
+            if self.source.is_at_synced_viewport(self.aspects):
+                return
+
+            self.destination.sync_to(self.source, self.aspects, skip_unchanged=True)
+        except Exception as e:
+            # this runs inside the source's change notifications, so stop
+            # syncing rather than raising on every subsequent change:
+            warnings.warn(f"Stopping real time sync after failed sync: {e}")
+            self.stop_real_time_sync()
 
     def start_real_time_sync(self, source, destination, aspects):
+        if source is destination:
+            raise ValueError("Cannot sync a viewer to itself.")
+
         # ensure we stop any previously configured real time sync
         self.stop_real_time_sync()
 
         self.source = source
         self.destination = destination
-        self.aspects = aspects
+        # filter the aspects once here, rather than on every sync:
+        self.aspects = VIEWPORT_SYNC_ASPECTS.intersection(aspects)
 
-        # call the sync method once manually to align the views
+        # call the sync method once manually to align the views, even if
+        # the destination was previously synced to the same viewport
         self.destination.sync_to(self.source, self.aspects)
 
         # add a callback to the source to update the destination when the view changes
@@ -28,9 +90,14 @@ class SyncManager():
 
     def stop_real_time_sync(self):
         prev_source = self.source
+        prev_destination = self.destination
         self.source = None
         self.destination = None
         self.aspects = []
 
         if prev_source:
             prev_source.remove_callback(self._callback)
+
+        # the destination is no longer synced, so forget what was synced to it:
+        if prev_destination:
+            prev_destination.clear_sync_cache()
@@ -0,0 +1,57 @@
+import asyncio
+
+
+class Throttler:
+    """
+    Wrap ``func`` so that it runs at most once per ``interval`` seconds.
+
+    The first call schedules ``func`` on the running event loop. Calls
+    that arrive before it runs are coalesced, and ``func`` is called once
+    with the arguments of the latest call. If there is no running event
+    loop, ``func`` is called immediately.
+    """
+
+    def __init__(self, func, interval=1 / 60):
+        """
+        Parameters
+        ----------
+        func : callable
+            Function to throttle.
+        interval : float
+            Minimum time between calls to ``func`` in seconds. Default is
+            1/60, one animation frame at 60 Hz.
+        """
+        self.func = func
+        self.interval = interval
+        self._pending = None
+        self._args = ()
+        self._kwargs = {}
+
+    def __call__(self, *args, **kwargs):
+        self._args = args
+        self._kwargs = kwargs
+
+        if self._pending is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._flush()
+
+        self._pending = loop.call_later(self.interval, self._flush)
+
+    def cancel(self):
+        """
+        Drop the pending call to ``func``, if there is one.
+        """
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        self._args, self._kwargs = (), {}
+
+    def _flush(self):
+        self._pending = None
+        args, kwargs = self._args, self._kwargs
+        self._args, self._kwargs = (), {}
+        return self.func(*args, **kwargs)
@@ -1,16 +1,194 @@
 from abc import ABC, abstractmethod
-from mast_aladin.aida import AIDA_aspects
+from contextlib import nullcontext
+
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import SkyCoord, angular_separation
+from traitlets import HasTraits
+
+from mast_aladin.aida import AIDA_aspects, VIEWPORT_SYNC_ASPECTS
+
+# fixed order of the aspects in a viewport key:
+_KEY_ASPECTS = (AIDA_aspects.CENTER, AIDA_aspects.FOV, AIDA_aspects.ROTATION)
+
+# viewers may report a synced viewport back rounded, or converted from
+# another frame, so viewports are taken to match if they differ by less
+# than this fraction of the field of view (in the center and fov) or
+# this many radians (in the rotation), about a screen pixel:
+_VIEWPORT_RTOL = 1e-3
+
+
+def _plain_value(value):
+    """
+    Convert a coordinate or quantity to plain floats, which are much
+    cheaper to compare than the astropy objects.
+    """
+    if isinstance(value, SkyCoord):
+        # centers given in different frames are compared in ICRS:
+        if value.frame.name != 'icrs':
+            value = value.icrs
+        spherical = value.spherical
+        return (spherical.lon.deg, spherical.lat.deg)
+    elif isinstance(value, u.Quantity):
+        return value.to_value(u.deg)
+    return value
+
+
+def _viewport_key(viewport, aspects):
+    """
+    Reduce the ``aspects`` of a viewport dictionary to a tuple of plain
+    values, with `None` for aspects that are not included.
+    """
+    return tuple(
+        _plain_value(viewport[aspect]) if aspect in aspects else None
+        for aspect in _KEY_ASPECTS
+    )
+
+
+def _viewport_keys_match(key, other_key, fov):
+    """
+    `True` if the viewport keys ``key`` and ``other_key`` (see
+    `_viewport_key`) include the same aspects and agree within
+    ``_VIEWPORT_RTOL`` of the field of view ``fov`` in degrees.
+    """
+    atol = _VIEWPORT_RTOL * fov
+    for aspect, value, other_value in zip(_KEY_ASPECTS, key, other_key):
+        if value is None or other_value is None:
+            if value is not other_value:
+                return False
+
+        elif aspect == AIDA_aspects.CENTER:
+            separation = angular_separation(
+                *np.radians(value), *np.radians(other_value)
+            )
+            if np.degrees(separation) > atol:
+                return False
+
+        elif aspect == AIDA_aspects.FOV:
+            if abs(value - other_value) > atol:
+                return False
+
+        else:
+            # the difference in rotation, wrapped to [-180, 180) degrees:
+            difference = (value - other_value + 180) % 360 - 180
+            if abs(np.radians(difference)) > _VIEWPORT_RTOL:
+                return False
+
+    return True
 
 
 class ViewerSyncAdapter(ABC):
-    def sync_to(self, sync_viewer, aspects):
+    # viewport most recently pushed to this viewer by `sync_to`:
+    _last_synced_viewport = None
+    # and the viewport this viewer reported right after it was pushed:
+    _reported_synced_viewport = None
+
+    def sync_to(self, sync_viewer, aspects, skip_unchanged=False):
+        """
+        Update this viewer's viewport to match ``sync_viewer`` in each of
+        the ``aspects``.
+
+        Parameters
+        ----------
+        sync_viewer : `ViewerSyncAdapter`
+            Viewer to take the viewport from.
+        aspects : iterable of str
+            Aspects of the viewport to sync, see `AIDA_aspects`.
+        skip_unchanged : bool, optional
+            If `True`, do nothing when the viewport of ``sync_viewer`` is
+            unchanged since it was last synced to this viewer, and this
+            viewer hasn't been moved since, as for real time syncing.
+            Default is `False`, which always updates this viewer.
+        """
         source_viewport = sync_viewer.aid.get_viewport(sky_or_pixel="sky")
 
-        new_viewport = self.aid.get_viewport(sky_or_pixel="sky").copy()
-        for aspect in set(aspects) & {AIDA_aspects.CENTER, AIDA_aspects.FOV, AIDA_aspects.ROTATION}:
-            new_viewport[aspect] = source_viewport[aspect]
+        aspects = VIEWPORT_SYNC_ASPECTS.intersection(aspects)
+
+        # skip the update if nothing changed since the last sync, before
+        # building any arguments for `set_viewport`. Only query this viewer
+        # if the source is unchanged, to check it hasn't been moved since:
+        viewport_key = _viewport_key(source_viewport, aspects)
+        if (
+            skip_unchanged
+            and viewport_key == self._last_synced_viewport
+            and self.is_at_synced_viewport(aspects)
+        ):
+            return
+
+        # only the synced aspects are passed to `set_viewport`, the others
+        # are left unchanged, so there's no need to query this viewer:
+        new_viewport = {aspect: source_viewport[aspect] for aspect in aspects}
+
+        # defer this viewer's trait validation and change notifications
+        # until every aspect has been set, so observers never see a
+        # partially updated viewport:
+        if isinstance(self.viewer, HasTraits):
+            hold = self.viewer.hold_trait_notifications()
+        else:
+            hold = nullcontext()
+
+        # record the viewport before applying it, so that the change
+        # notifications it fires are already recognized as coming from this
+        # sync (see `is_at_synced_viewport`), but forget it if it fails:
+        previous_keys = self._last_synced_viewport, self._reported_synced_viewport
+        self._last_synced_viewport = viewport_key
+        self._reported_synced_viewport = None
+        try:
+            with hold:
+                self.aid.set_viewport(**new_viewport)
+        except Exception:
+            self._last_synced_viewport, self._reported_synced_viewport = previous_keys
+            raise
+
+        # viewers may not report the pushed viewport back exactly, or not
+        # right away (e.g. aladin's fov is updated by the frontend), so
+        # the viewport change notifications to come may report either:
+        self._reported_synced_viewport = _viewport_key(
+            self.aid.get_viewport(sky_or_pixel="sky"), aspects
+        )
+
+    def is_at_synced_viewport(self, aspects):
+        """
+        `True` if this viewer's viewport in each of the ``aspects`` is
+        the one last applied to it by `sync_to`, i.e. it hasn't been moved
+        since. The viewport may differ from the applied one by rounding
+        or a change of frame, see ``_VIEWPORT_RTOL``.
+
+        Parameters
+        ----------
+        aspects : iterable of str
+            Aspects of the viewport to compare, see `AIDA_aspects`.
+        """
+        if self._last_synced_viewport is None:
+            return False
+
+        viewport = self.aid.get_viewport(sky_or_pixel="sky")
+        aspects = VIEWPORT_SYNC_ASPECTS.intersection(aspects)
+        viewport_key = _viewport_key(viewport, aspects)
+        fov = _plain_value(viewport[AIDA_aspects.FOV])
+        return any(
+            _viewport_keys_match(viewport_key, synced_key, fov)
+            for synced_key in (self._last_synced_viewport, self._reported_synced_viewport)
+            if synced_key is not None
+        )
+
+    @property
+    def closed(self):
+        """
+        `True` if the viewer's widget has been closed, and can no longer
+        be synced.
+        """
+        return False
 
-        self.aid.set_viewport(**new_viewport)
+    def clear_sync_cache(self):
+        """
+        Forget the last synced viewport, so the next call to `sync_to`
+        updates this viewer even with ``skip_unchanged=True``, and changes
+        to this viewer are no longer taken for echoes of a sync. Called
+        when a real time sync to this viewer stops.
+        """
+        self._last_synced_viewport = None
+        self._reported_synced_viewport = None
 
     @abstractmethod
     def add_callback(self, func):
@@ -1,5 +1,4 @@
 import ipywidgets as widgets
-from IPython.display import display
 
 from mast_aladin.adapters import ImvizSyncAdapter, AladinSyncAdapter, SyncManager
 
@@ -76,6 +75,8 @@ class ViewerSyncUI():
         )
 
     def display(self):
+        from IPython.display import display
+
         self.imviz.layout = widgets.Layout(width="70%", height="100px")
         self.mast_aladin.layout = widgets.Layout(width="70%", height="100px")
 
@@ -1,8 +1,32 @@
-from datetime import datetime
-from echo import delay_callback
+import time
+from itertools import count
 from traitlets import Unicode, Bool, Float, observe, HasTraits
 
 from mast_aladin import gca
+from .throttle import Throttler
+
+
+class _RegionOverlay:
+    """
+    Keyword arguments for drawing a region overlay in jdaviz, stored in a
+    fixed layout so that one instance can be reused for every redraw.
+    Supports item access and ``**`` unpacking like a dict.
+    """
+    __slots__ = ('region', 'region_label', 'colors', 'stroke_width')
+
+    def __init__(self):
+        self.region = None
+        self.region_label = None
+        self.colors = []
+        self.stroke_width = None
+
+    def keys(self):
+        return self.__slots__
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
 
 
 class ViewportOutline(HasTraits):
@@ -29,6 +53,13 @@ class ViewportOutline(HasTraits):
     aladin_overlay = None
     jdaviz_overlay = None
 
+    # shared by all instances, so that outline labels are always unique:
+    _label_counter = count()
+
+    # whether the viewport callbacks are currently registered in each app:
+    _observing_aladin = False
+    _observing_jdaviz = False
+
     outline_color = Unicode('#ff0000').tag(sync=True)
     outline_width = Float(4).tag(sync=True)
     jdaviz_outline_in_aladin = Bool(True).tag(sync=True)
@@ -56,7 +87,17 @@ class ViewportOutline(HasTraits):
             Default is True.
         """
         self.jdaviz_viewer = jdaviz_viewer
+        self._glue_viewer = jdaviz_viewer._obj.glue_viewer
         self.aladin = aladin
+
+        # redraw outlines at most once per animation frame while panning:
+        self._throttled_update_aladin_outline_in_jdaviz = Throttler(
+            self._update_aladin_outline_in_jdaviz
+        )
+        self._throttled_update_jdaviz_outline_in_aladin = Throttler(
+            self._update_jdaviz_outline_in_aladin
+        )
+
         self.aladin_outline_in_jdaviz = aladin_outline_in_jdaviz
         self.jdaviz_outline_in_aladin = jdaviz_outline_in_aladin
 
@@ -69,7 +110,7 @@ class ViewportOutline(HasTraits):
         """
         if self.aladin_overlay is not None:
             overlay_label = self.aladin_overlay['options']['name']
-            if overlay_label in self.aladin._overlays:
+            if overlay_label in self.aladin._overlays_dict:
                 self.aladin.remove_overlay(self.aladin_overlay)
 
     def _clear_aladin_outline_in_jdaviz(self):
@@ -77,7 +118,7 @@ class ViewportOutline(HasTraits):
         Clear the latest mast-aladin viewport outline drawn in jdaviz.
         """
         if self.jdaviz_overlay is not None:
-            glue_viewer = self.jdaviz_viewer._obj.glue_viewer
+            glue_viewer = self._glue_viewer
             overlay_label = self.jdaviz_overlay['region_label']
             if overlay_label in glue_viewer._get_region_overlay_labels():
                 glue_viewer._remove_region_overlay(overlay_label)
@@ -112,23 +153,27 @@ class ViewportOutline(HasTraits):
                 "in the Jupyter environment."
             )
 
-        self.jdaviz_overlay = dict(
-            region=self.aladin.get_viewport_region(),
-            region_label=self._viewport_label(app_name='mast-aladin'),
-            colors=[self.outline_color],
-            stroke_width=self.outline_width,
-        )
-        glue_viewer = self.jdaviz_viewer._obj.glue_viewer
-        glue_viewer._add_region_overlay(**self.jdaviz_overlay)
+        if self.jdaviz_overlay is None:
+            self.jdaviz_overlay = _RegionOverlay()
+
+        overlay = self.jdaviz_overlay
+        overlay.region = self.aladin.get_viewport_region()
+        overlay.region_label = self._viewport_label(app_name='mast-aladin')
+        if not overlay.colors or overlay.colors[0] != self.outline_color:
+            overlay.colors = [self.outline_color]
+        overlay.stroke_width = self.outline_width
+        self._glue_viewer._add_region_overlay(**self.jdaviz_overlay)
 
     def _viewport_label(self, app_name=None):
         """
-        Generate a label for the viewport outline overlay layers.
+        Generate a unique label for the viewport outline overlay layers.
         """
-        # hours, minutes, seconds:
-        time = datetime.now().time().strftime('%H:%M:%S')
+        # hours, minutes, seconds, which are not unique for outlines
+        # redrawn within the same second, so add a counter:
+        timestamp = time.strftime('%H:%M:%S', time.localtime())
         return (
-            ('' if app_name is None else f"{app_name} @ ") + time
+            ('' if app_name is None else f"{app_name} @ ") +
+            f"{timestamp} #{next(self._label_counter)}"
         )
 
     @observe('jdaviz_outline_in_aladin', 'aladin_outline_in_jdaviz')
@@ -139,41 +184,70 @@ class ViewportOutline(HasTraits):
         if self.aladin_outline_in_jdaviz:
             # add jdaviz viewport overlay in mast-aladin
             self._update_aladin_outline_in_jdaviz()
-
-            # observe mast-aladin traitlets to trigger updates in jdaviz:
-            self.aladin.observe(self._update_aladin_outline_in_jdaviz, '_fov')
-            self.aladin.observe(self._update_aladin_outline_in_jdaviz, '_target')
         else:
             self._clear_aladin_outline_in_jdaviz()
 
         if self.jdaviz_outline_in_aladin:
             self._update_jdaviz_outline_in_aladin()
-            glue_viewer = self.jdaviz_viewer._obj.glue_viewer
-
-            # add callback to jdaviz viewerport limits to trigger updates in mast-aladin
-            glue_viewer.state.add_callback(
-                'x_min', self._update_jdaviz_outline_in_aladin
-            )
-
         else:
             self._clear_jdaviz_outline_in_aladin()
 
+        self._update_viewport_callbacks()
+
+    def _update_viewport_callbacks(self):
+        """
+        Redraw each outline when the viewport it traces changes, only
+        while that outline is shown. Callbacks are added or removed when
+        the corresponding outline is turned on or off.
+        """
+        if self.aladin_outline_in_jdaviz != self._observing_aladin:
+            # observe mast-aladin traitlets to trigger updates in jdaviz:
+            if self.aladin_outline_in_jdaviz:
+                self.aladin.observe(
+                    self._throttled_update_aladin_outline_in_jdaviz,
+                    names=['_fov', '_target']
+                )
+            else:
+                self.aladin.unobserve(
+                    self._throttled_update_aladin_outline_in_jdaviz,
+                    names=['_fov', '_target']
+                )
+                self._throttled_update_aladin_outline_in_jdaviz.cancel()
+            self._observing_aladin = self.aladin_outline_in_jdaviz
+
+        if self.jdaviz_outline_in_aladin != self._observing_jdaviz:
+            # callback on jdaviz viewerport limits to trigger updates in mast-aladin
+            if self.jdaviz_outline_in_aladin:
+                self._glue_viewer.state.add_callback(
+                    'x_min', self._throttled_update_jdaviz_outline_in_aladin
+                )
+            else:
+                self._glue_viewer.state.remove_callback(
+                    'x_min', self._throttled_update_jdaviz_outline_in_aladin
+                )
+                self._throttled_update_jdaviz_outline_in_aladin.cancel()
+            self._observing_jdaviz = self.jdaviz_outline_in_aladin
+
     @observe('outline_color', 'outline_width')
     def _redraw(self, msg={}):
         """
-        Force an udpate on the overlays
+        Force an udpate on the overlays. The redraw is scheduled on the
+        event loop rather than run inside the trait notification, so that
+        changing the color and width together only redraws once.
         """
         if self.aladin_outline_in_jdaviz:
-            self._update_aladin_outline_in_jdaviz()
+            self._throttled_update_aladin_outline_in_jdaviz()
         if self.jdaviz_outline_in_aladin:
-            self._update_jdaviz_outline_in_aladin()
+            self._throttled_update_jdaviz_outline_in_aladin()
 
     def clear_all(self):
         """
         Clear all outlines, including those that were created by another
         instance of ``ViewportOutline``.
         """
-        with delay_callback('jdaviz_outline_in_aladin', 'aladin_outline_in_jdaviz'):
+        # turn both outlines off before the observers run, so neither
+        # outline is redrawn while the other is being turned off:
+        with self.hold_trait_notifications():
             self.jdaviz_outline_in_aladin = False
             self.aladin_outline_in_jdaviz = False
 
@@ -184,18 +258,21 @@ class ViewportOutline(HasTraits):
         Find and remove existing outlines drawn by any instance of `ViewportOutline`.
         """
         aladin_overlays_to_remove = [
-            overlay_name for overlay_name in self.aladin.overlays
+            overlay_name for overlay_name in self.aladin._overlays_dict.keys()
             if overlay_name.startswith('jdaviz @')
         ]
-        self.aladin.remove_overlay(aladin_overlays_to_remove)
+        # skip the message to the widget when there's nothing to remove:
+        if aladin_overlays_to_remove:
+            self.aladin.remove_overlay(aladin_overlays_to_remove)
 
-        glue_viewer = self.jdaviz_viewer._obj.glue_viewer
+        glue_viewer = self._glue_viewer
         jdaviz_overlays = glue_viewer._get_region_overlay_labels()
         jdaviz_overlays_to_remove = [
             overlay_name for overlay_name in jdaviz_overlays
             if overlay_name.startswith('mast-aladin @')
         ]
-        glue_viewer._remove_region_overlay(jdaviz_overlays_to_remove)
+        if jdaviz_overlays_to_remove:
+            glue_viewer._remove_region_overlay(jdaviz_overlays_to_remove)
 
     @classmethod
     def for_current_apps(cls, jdaviz_viewer_name=None):
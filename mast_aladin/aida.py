@@ -11,6 +11,12 @@ class AIDA_aspects(StrEnum):
     IMAGE_LABEL = "image_label"
 
 
+# aspects of the viewport which can be synced between viewers:
+VIEWPORT_SYNC_ASPECTS = frozenset(
+    {AIDA_aspects.CENTER, AIDA_aspects.FOV, AIDA_aspects.ROTATION}
+)
+
+
 class AID:
     """
     Provides API for mast-aladin to allow for parity with
@@ -1,5 +1,6 @@
 import io
 import os
+import weakref
 
 from ipyaladin import Aladin
 from mast_table import MastTable
@@ -29,7 +30,8 @@ __all__ = [
     'gca',
 ]
 
-# store reference to the latest instantiation:
+# store a weak reference to the latest instantiation, so that it
+# can be garbage collected once it is closed:
 _latest_instantiated_app = None
 
 
@@ -47,7 +49,7 @@ class MastAladin(Aladin, DelayUntilRendered):
         self.aid = AID(self)
 
         global _latest_instantiated_app
-        _latest_instantiated_app = self
+        _latest_instantiated_app = weakref.ref(self)
 
         self._overlays_dict = OverlayManager(self)
         self.sidecar = kwargs.get("sidecar", None)
@@ -68,7 +70,9 @@ class MastAladin(Aladin, DelayUntilRendered):
 
         if load_footprints:
             if 's_region' in table.colnames:
-                self.add_graphic_overlay_from_stcs(table['s_region'])
+                # convert the column to a list of strings in one call, rather
+                # than element by element while building the regions:
+                self.add_graphic_overlay_from_stcs(table['s_region'].tolist())
             else:
                 raise ValueError(
                     "The table does not contain an `s_region` column, so no "
@@ -398,7 +402,10 @@ def gca():
     -------
     MastAladin
     """
-    if _latest_instantiated_app is None:
+    latest_app = (
+        _latest_instantiated_app() if _latest_instantiated_app is not None else None
+    )
+    if latest_app is None:
         return MastAladin()
 
-    return _latest_instantiated_app
+    return latest_app
@@ -1,42 +1,162 @@
+import sys
 import solara
 import warnings
+import weakref
+from functools import lru_cache
 from ipyaladin import Aladin
 from sidecar import Sidecar as UpstreamSidecar
 from mast_table import MastTable
 from mast_aladin.app import MastAladin, gca
 
-try:
-    from jdaviz.core.helpers import ConfigHelper
-except ImportError:
-    ConfigHelper = None
-
 default_height = 500
 default_anchor = 'split-right'
 
+# jdaviz's ConfigHelper class, once jdaviz has been imported, see `is_jdaviz`:
+_ConfigHelper = None
+
 
 def is_jdaviz(app):
     """
-    If jdaviz can be imported, check app is instanace of ConfigHelper;
-    otherwise you can't have a jdaviz app:
+    If jdaviz has been imported, check app is instanace of ConfigHelper;
+    otherwise you can't have a jdaviz app. This avoids importing jdaviz
+    (which is slow) just to check the type of an app.
+    """
+    global _ConfigHelper
+    if _ConfigHelper is None:
+        jdaviz_helpers = sys.modules.get('jdaviz.core.helpers')
+        if jdaviz_helpers is None:
+            return False
+        _ConfigHelper = jdaviz_helpers.ConfigHelper
+
+    return isinstance(app, _ConfigHelper)
+
+
+@lru_cache(maxsize=None)
+def _imviz_helper():
+    """
+    Return the ``jdaviz.configs.imviz.helper`` module, or `None` if jdaviz
+    is not installed. The import is deferred until Imviz is first needed
+    (importing jdaviz is slow), and the result is cached, so the warning
+    for a missing jdaviz is only given once.
     """
-    if ConfigHelper is not None:
-        return isinstance(app, ConfigHelper)
+    try:
+        from jdaviz.configs.imviz import helper
+    except ImportError:
+        warnings.warn(
+            "`AppSidecar` found that jdaviz was not installed. To install it, "
+            "run `pip install jdaviz`.",
+            UserWarning
+        )
+        return None
 
-    return False
+    return helper
 
 
 def is_aladin(app):
     return isinstance(app, Aladin)
 
 
+def app_kind(app):
+    """
+    Classify ``app`` as ``"jdaviz"``, ``"aladin"``, ``"table"`` (for a
+    ``MastTable``), or ``"other"``.
+    """
+    if is_jdaviz(app):
+        return 'jdaviz'
+    elif is_aladin(app):
+        return 'aladin'
+    elif isinstance(app, MastTable):
+        return 'table'
+
+    return 'other'
+
+
+def _css_height(height):
+    """
+    Convert ``height``, either an integer in units of pixels or a
+    string like "100%", into a CSS length.
+    """
+    if isinstance(height, int):
+        return f"{height}px"
+    return height
+
+
+@solara.component
+def SidecarContents(apps, kinds, height):
+    """
+    Lay out ``apps`` side by side in a sidecar. ``kinds`` gives the
+    kind of each app (see `app_kind`), and ``height`` is passed to
+    `set_app_height` for each app.
+    """
+    # only rebuild the column style and widths when the layout changes:
+    style, widths = solara.use_memo(
+        lambda: (f"height: {_css_height(height)} !important;", len(apps) * [1]),
+        [height, len(apps)],
+    )
+
+    def apply_height():
+        for app, kind in zip(apps, kinds):
+            set_app_height(app, height, kind=kind)
+
+    # only resize the apps when they or the height change, not on every render:
+    solara.use_effect(apply_height, [tuple(id(app) for app in apps), height])
+
+    with solara.Columns(widths, gutters_dense=True) as main:
+        for app, kind in zip(apps, kinds):
+
+            if kind == 'aladin':
+                # MastAladin:
+                with solara.Column(gap='0px', style=style):
+                    solara.display(app)
+
+            elif kind == 'jdaviz':
+                # jdaviz:
+                with solara.Column(gap='0px', style=style):
+                    solara.display(app.app)
+
+            else:
+                # other:
+                with solara.Column(gap='0px'):
+                    solara.display(app)
+
+    return main
+
+
 class AppSidecarManager:
-    _sidecar_context = None
-    _jdaviz_counter = 0
-    _aladin_counter = 0
-    _other_counter = 0
+    __slots__ = (
+        "loaded_apps",
+        "_kinds",
+        "_sidecar_context",
+        "_jdaviz_counter",
+        "_aladin_counter",
+        "_other_counter",
+    )
 
     def __init__(self):
         self.loaded_apps = []
+        self._sidecar_context = None
+        self._jdaviz_counter = 0
+        self._aladin_counter = 0
+        self._other_counter = 0
+
+        # kind of each app, see `app_kind`. Keyed on the apps themselves
+        # (not their ids, which may be reused once an app is garbage
+        # collected), without keeping them alive:
+        self._kinds = weakref.WeakKeyDictionary()
+
+    def _kind(self, app):
+        """
+        Return the kind of ``app``, classifying it on first use.
+        """
+        try:
+            kind = self._kinds.get(app)
+        except TypeError:
+            # apps that can't be weakly referenced aren't cached:
+            return app_kind(app)
+
+        if kind is None:
+            kind = self._kinds[app] = app_kind(app)
+        return kind
 
     def open(
         self,
@@ -113,7 +233,9 @@ class AppSidecarManager:
         if not apps:
             raise ValueError("No apps to show in sidecar.")
 
-        self.loaded_apps += apps
+        # apps may already be loaded if `close_existing` is `False`:
+        loaded_ids = {id(app) for app in self.loaded_apps}
+        self.loaded_apps += [app for app in apps if id(app) not in loaded_ids]
 
         self._attach_sidecars(apps, anchor, titles)
 
@@ -131,50 +253,50 @@ class AppSidecarManager:
             # if no apps are given, include one of each:
             include_jdaviz = include_aladin = True
 
-        mal_instances = [app for app in apps if is_aladin(app)]
-        jdaviz_instances = [app for app in apps if is_jdaviz(app)]
+        # check the given apps' kinds in one pass:
+        kinds = {self._kind(app) for app in apps}
 
-        if not len(mal_instances) and include_aladin:
+        if 'aladin' not in kinds and include_aladin:
             mal = gca()
             if not use_current_apps or (use_current_apps and mal is None):
                 mal = MastAladin()
             apps.append(mal)
 
-        try:
-            from jdaviz.configs.imviz.helper import Imviz, _current_app as viz
-
-            jdaviz_instances = [app for app in apps if is_jdaviz(app)]
+        # only import jdaviz when a jdaviz app is needed:
+        if 'jdaviz' not in kinds and include_jdaviz:
+            imviz_helper = _imviz_helper()
+            if imviz_helper is not None:
+                # the current app changes as Imviz instances are created, so look it up now:
+                viz = imviz_helper._current_app
 
-            # construct new imviz if not using current app or no current app exists:
-            if not len(jdaviz_instances) and include_jdaviz:
+                # construct new imviz if not using current app or no current app exists:
                 if not use_current_apps or (use_current_apps and viz is None):
-                    viz = Imviz()
+                    viz = imviz_helper.Imviz()
                 apps.append(viz)
 
-        except ImportError:
-            warnings.warn(
-                "`AppSidecar` found that jdaviz was not installed. To install it, "
-                "run `pip install jdaviz`.",
-                UserWarning
-            )
-
-        default_titles = []
-        for app in apps:
-            if is_jdaviz(app):
-                default_titles.append(
-                    "jdaviz" + (f" ({self._jdaviz_counter})" if self._jdaviz_counter else '')
+        # count in locals, and store the totals once the titles are built:
+        jdaviz_counter = self._jdaviz_counter
+        aladin_counter = self._aladin_counter
+        other_counter = self._other_counter
+
+        default_titles = [None] * len(apps)
+        for i, app in enumerate(apps):
+            kind = self._kind(app)
+            if kind == 'jdaviz':
+                default_titles[i] = f"jdaviz ({jdaviz_counter})" if jdaviz_counter else "jdaviz"
+                jdaviz_counter += 1
+            elif kind == 'aladin':
+                default_titles[i] = (
+                    f"mast-aladin ({aladin_counter})" if aladin_counter else "mast-aladin"
                 )
-                self._jdaviz_counter += 1
-            elif is_aladin(app):
-                default_titles.append(
-                    "mast-aladin" + (f" ({self._aladin_counter})" if self._aladin_counter else '')
-                )
-                self._aladin_counter += 1
+                aladin_counter += 1
             else:
-                default_titles.append(
-                    "Sidecar" + (f" ({self._other_counter})" if self._other_counter else '')
-                )
-                self._other_counter += 1
+                default_titles[i] = f"Sidecar ({other_counter})" if other_counter else "Sidecar"
+                other_counter += 1
+
+        self._jdaviz_counter = jdaviz_counter
+        self._aladin_counter = aladin_counter
+        self._other_counter = other_counter
         return apps, default_titles
 
     def _attach_sidecars(self, apps, anchor, titles):
@@ -184,27 +306,26 @@ class AppSidecarManager:
         In the multiple case, each sidecar `n` will reference the
         `n-1` sidecar instance.
         """
-        if not isinstance(anchor, list):
-            anchor = [anchor]
+        anchors = tuple(anchor) if isinstance(anchor, (list, tuple)) else (anchor,)
 
-        if len(anchor) == 1:
+        if len(anchors) == 1:
             # shared single sidecar
-            ctx = UpstreamSidecar(anchor=anchor[0], title=titles[0])
+            ctx = UpstreamSidecar(anchor=anchors[0], title=titles[0])
             for app in apps:
                 app.sidecar = ctx
 
         else:
             # multiple sidecars
-            anchor = self._normalize_anchor(anchor, apps)
+            anchors = self._normalize_anchor(anchors, apps)
+            new_sidecar = UpstreamSidecar
             ref = None
-            for app, anc, title in zip(apps, anchor, titles):
-                ctx = UpstreamSidecar(anchor=anc, title=title, ref=ref)
-                app.sidecar = ctx
-                ref = ctx
+            for app, anc, title in zip(apps, anchors, titles):
+                # each sidecar is placed relative to the previous one:
+                app.sidecar = ref = new_sidecar(anchor=anc, title=title, ref=ref)
 
     def _normalize_anchor(self, anchor, apps):
         """
-        Ensure anchor is a list of correct length
+        Ensure the tuple of anchors has the correct length
         """
         n_apps = len(apps)
         n_anchors = len(anchor)
@@ -215,86 +336,92 @@ class AppSidecarManager:
                 f"Filling missing anchors with `{default_anchor}`."
             )
 
-            return anchor + [default_anchor] * (n_apps-n_anchors)
+            return anchor + (default_anchor,) * (n_apps-n_anchors)
         return anchor
 
     def _display_sidecar_contents(self, apps, height):
-        @solara.component
-        def SidecarContents(apps):
-            style = f"height={height} !important;"
-
-            with solara.Columns(len(apps) * [1], gutters_dense=True) as main:
-                for app in apps:
-
-                    if is_aladin(app):
-                        # MastAladin:
-                        with solara.Column(gap='0px', style=style):
-                            solara.display(app)
-
-                    elif is_jdaviz(app):
-                        # jdaviz:
-                        with solara.Column(gap='0px', style=style):
-                            solara.display(app.app)
-
-                    else:
-                        # other:
-                        with solara.Column(gap='0px'):
-                            solara.display(app)
-
-                    set_app_height(app, height)
-
-            return main
-
+        # render each sidecar's apps together, in one component:
+        apps_per_sidecar = {}
         for app in apps:
-            with app.sidecar:
-                solara.display(SidecarContents(apps=[app]))
+            ctx = app.sidecar
+            apps_per_sidecar.setdefault(id(ctx), (ctx, []))[1].append(app)
+
+        for ctx, sidecar_apps in apps_per_sidecar.values():
+            with ctx:
+                solara.display(SidecarContents(
+                    apps=tuple(sidecar_apps),
+                    kinds=tuple(self._kind(app) for app in sidecar_apps),
+                    height=height,
+                ))
 
     def close_all(self):
         """
         Close this particular `sidecar` instance.
         """
+        closed_ids = set()
+        # apps may share a sidecar, so collect them to close each only once:
+        sidecars = {}
         for app in self.loaded_apps:
+            # only close each app once, even if it was loaded more than once:
+            if id(app) in closed_ids:
+                continue
+            closed_ids.add(id(app))
+
             # close jdaviz apps within the sidecar:
-            if is_jdaviz(app):
+            if self._kind(app) == 'jdaviz':
                 app.app.close()
 
-            # now close sidecar(s):
-            if getattr(app, 'sidecar', None) is not None:
-                app.sidecar.close()
+            ctx = getattr(app, 'sidecar', None)
+            if ctx is not None:
+                sidecars[id(ctx)] = ctx
+
+        # now close sidecar(s):
+        for ctx in sidecars.values():
+            ctx.close()
         self.loaded_apps = []
+        self._kinds.clear()
 
     def resize_all(self, height=default_height):
         """
         Resize all opened sidecars with ``height`` in pixels.
         """
         for app in self.loaded_apps:
-            set_app_height(app, height)
+            set_app_height(app, height, kind=self._kind(app))
 
 
-def set_app_height(app, height):
+def set_app_height(app, height, kind=None):
     """
     For an app instance ``app``, set the app height to be
     ``height`` pixels. ``height`` may be an integer in units
-    of pixels, or "100%".
+    of pixels, or "100%". If the ``kind`` of app is known
+    (see `app_kind`), pass it to skip checking the app type.
     """
-    if is_jdaviz(app):
-        if isinstance(height, int):
-            height = f"{height}px"
+    if kind is None:
+        kind = app_kind(app)
 
-        app.app.layout.height = height
-        app.app.state.settings['context']['notebook']['max_height'] = height
+    # each assignment below is synced to the browser, so skip unchanged heights:
+    if kind == 'jdaviz':
+        height = _css_height(height)
 
-    elif is_aladin(app):
+        if app.app.layout.height != height:
+            app.app.layout.height = height
+
+        notebook_settings = app.app.state.settings['context']['notebook']
+        if notebook_settings.get('max_height') != height:
+            notebook_settings['max_height'] = height
+
+    elif kind == 'aladin':
         if height == '100%':
-            app.height = -1
-        elif isinstance(height, int):
+            height = -1
+
+        if isinstance(height, int) and app.height != height:
             app.height = height
 
-    elif isinstance(app, MastTable):
-        if isinstance(height, int):
-            height = f"{height}px"
+    elif kind == 'table':
+        height = _css_height(height)
 
-        app.layout.height = height
+        if app.layout.height != height:
+            app.layout.height = height
 
 
 AppSidecar = AppSidecarManager()
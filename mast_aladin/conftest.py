@@ -2,7 +2,6 @@ import os
 import pytest
 from astropy.table import Table
 from mast_aladin import MastAladin
-from jdaviz import Imviz
 
 
 @pytest.fixture
@@ -12,6 +11,8 @@ def MastAladin_app():
 
 @pytest.fixture
 def imviz_helper():
+    # importing jdaviz is slow, so only import it for tests which use it:
+    from jdaviz import Imviz
     return Imviz()
 
 
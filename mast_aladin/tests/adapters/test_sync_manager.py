@@ -0,0 +1,333 @@
+import asyncio
+
+import pytest
+from astropy.coordinates import SkyCoord
+import astropy.units as u
+
+from mast_aladin.adapters import SyncManager
+from mast_aladin.adapters.viewer_sync_adapter import ViewerSyncAdapter
+
+
+class MockSyncAdapter:
+    closed = False
+
+    def __init__(self):
+        self.callbacks = []
+        self.synced_from = []
+        self.n_cleared = 0
+
+    def sync_to(self, sync_viewer, aspects, skip_unchanged=False):
+        self.synced_from.append(sync_viewer)
+
+    def clear_sync_cache(self):
+        self.n_cleared += 1
+
+    def is_at_synced_viewport(self, aspects):
+        return False
+
+    def add_callback(self, func):
+        self.callbacks.append(func)
+
+    def remove_callback(self, func):
+        self.callbacks.remove(func)
+
+    def fire(self):
+        for func in list(self.callbacks):
+            func(None)
+
+
+def test_sync_without_event_loop_is_immediate():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager.start_real_time_sync(source, destination, SyncManager.ASPECTS)
+
+    # one sync on start, one per change:
+    source.fire()
+    source.fire()
+    assert len(destination.synced_from) == 3
+
+
+def test_sync_callbacks_are_coalesced():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager._delay_ms = 10
+
+    async def pan():
+        sync_manager.start_real_time_sync(source, destination, SyncManager.ASPECTS)
+
+        # center, fov, and rotation changes from a single pan:
+        for _ in range(3):
+            source.fire()
+
+        await asyncio.sleep(0.05)
+
+    asyncio.run(pan())
+
+    # one sync on start, and one for all three changes:
+    assert len(destination.synced_from) == 2
+
+
+def test_pending_sync_dropped_after_stop():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager._delay_ms = 10
+
+    async def pan_then_stop():
+        sync_manager.start_real_time_sync(source, destination, SyncManager.ASPECTS)
+        source.fire()
+        sync_manager.stop_real_time_sync()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(pan_then_stop())
+
+    assert len(destination.synced_from) == 1
+    assert not source.callbacks
+
+
+def test_sync_stops_when_viewer_closed():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager._delay_ms = 0
+    sync_manager.start_real_time_sync(source, destination, SyncManager.ASPECTS)
+
+    destination.closed = True
+    source.fire()
+    assert len(destination.synced_from) == 1
+    assert not source.callbacks
+    assert sync_manager.source is None
+
+
+def test_sync_stops_when_sync_fails():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager._delay_ms = 0
+    sync_manager.start_real_time_sync(source, destination, SyncManager.ASPECTS)
+
+    def fail(sync_viewer, aspects, **kwargs):
+        raise RuntimeError("viewer is gone")
+
+    destination.sync_to = fail
+    with pytest.warns(UserWarning, match="viewer is gone"):
+        source.fire()
+    assert not source.callbacks
+
+
+def test_sync_to_self_raises():
+    viewer = MockSyncAdapter()
+    with pytest.raises(ValueError, match="itself"):
+        SyncManager().start_real_time_sync(viewer, viewer, SyncManager.ASPECTS)
+
+
+class MockAID:
+    def __init__(self, on_change=None, lossy=False):
+        self.viewport = dict(
+            center=SkyCoord(9.42, -33.71, unit="deg"),
+            fov=1 * u.deg,
+            rotation=0,
+            image_label=None,
+        )
+        self.n_get_viewport = 0
+        self.n_set_viewport = 0
+        self.on_change = on_change
+        self.lossy = lossy
+
+    def get_viewport(self, sky_or_pixel="sky"):
+        self.n_get_viewport += 1
+        return self.viewport
+
+    def set_viewport(self, **kwargs):
+        self.n_set_viewport += 1
+        if self.lossy:
+            return self._set_viewport_lossy(**kwargs)
+
+        self.viewport = {**self.viewport, **kwargs}
+        if self.on_change is not None:
+            self.on_change()
+
+    def _set_viewport_lossy(self, center=None, fov=None, rotation=None):
+        # like a real viewer, report the center in another frame and
+        # rounded, and update the fov later, as aladin's frontend does:
+        viewport = dict(self.viewport)
+        if center is not None:
+            galactic = center.galactic
+            viewport["center"] = SkyCoord(
+                round(galactic.l.deg, 6), round(galactic.b.deg, 6),
+                unit="deg", frame="galactic"
+            )
+        if rotation is not None:
+            viewport["rotation"] = rotation + 1e-6 * u.deg
+        self.viewport = viewport
+        self.on_change()
+
+        if fov is not None:
+            def update_fov():
+                self.viewport = {**self.viewport, "fov": fov * (1 + 1e-6)}
+                self.on_change()
+
+            asyncio.get_running_loop().call_soon(update_fov)
+
+    def pan(self, center):
+        # a change made by the user, rather than by a sync:
+        self.viewport = {**self.viewport, "center": center}
+        self.on_change()
+
+
+class MockViewerSyncAdapter(ViewerSyncAdapter):
+    def __init__(self, lossy=False):
+        self.viewer = None
+        self.aid = MockAID(on_change=self._fire, lossy=lossy)
+        self.callbacks = []
+
+    def _fire(self):
+        for func in list(self.callbacks):
+            func(None)
+
+    def add_callback(self, func):
+        self.callbacks.append(func)
+
+    def remove_callback(self, func):
+        self.callbacks.remove(func)
+
+    def show(self):
+        pass
+
+
+def test_sync_to_skips_unchanged_viewport():
+    source, destination = MockViewerSyncAdapter(), MockViewerSyncAdapter()
+    aspects = SyncManager.ASPECTS
+
+    destination.sync_to(source, aspects, skip_unchanged=True)
+    n_get_viewport = destination.aid.n_get_viewport
+    destination.sync_to(source, aspects, skip_unchanged=True)
+    assert destination.aid.n_set_viewport == 1
+    # the skipped sync only checks that the destination hasn't moved:
+    assert destination.aid.n_get_viewport == n_get_viewport + 1
+
+    source.aid.viewport["fov"] = 2 * u.deg
+    destination.sync_to(source, aspects, skip_unchanged=True)
+    assert destination.aid.n_set_viewport == 2
+
+    destination.clear_sync_cache()
+    destination.sync_to(source, aspects, skip_unchanged=True)
+    assert destination.aid.n_set_viewport == 3
+
+
+def test_sync_to_applies_unchanged_viewport_to_moved_viewer():
+    source, destination = MockViewerSyncAdapter(), MockViewerSyncAdapter()
+    aspects = SyncManager.ASPECTS
+
+    destination.sync_to(source, aspects, skip_unchanged=True)
+
+    # the destination is panned by hand, then the source reports the
+    # viewport that was already synced:
+    destination.aid.viewport["center"] = SkyCoord(10, -30, unit="deg")
+    destination.sync_to(source, aspects, skip_unchanged=True)
+    assert destination.aid.n_set_viewport == 2
+    assert destination.aid.viewport["center"] is source.aid.viewport["center"]
+
+
+def test_stopping_sync_clears_destination_cache():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager.start_real_time_sync(source, destination, SyncManager.ASPECTS)
+    assert destination.n_cleared == 0
+
+    # changing the sync direction stops the previous sync:
+    sync_manager.start_real_time_sync(destination, source, SyncManager.ASPECTS)
+    assert destination.n_cleared == 1
+    assert source.n_cleared == 0
+
+    sync_manager.stop_real_time_sync()
+    assert source.n_cleared == 1
+
+
+def test_direct_sync_to_always_applies():
+    source, destination = MockViewerSyncAdapter(), MockViewerSyncAdapter()
+    aspects = SyncManager.ASPECTS
+
+    destination.sync_to(source, aspects)
+
+    # the destination is panned by hand, while the source stays put:
+    destination.aid.viewport["center"] = SkyCoord(10, -30, unit="deg")
+    destination.sync_to(source, aspects)
+    assert destination.aid.n_set_viewport == 2
+    assert destination.aid.viewport["center"] is source.aid.viewport["center"]
+
+
+def test_failed_sync_is_not_cached():
+    source, destination = MockViewerSyncAdapter(), MockViewerSyncAdapter()
+    aspects = SyncManager.ASPECTS
+
+    def fail(**kwargs):
+        raise RuntimeError("viewer is gone")
+
+    set_viewport, destination.aid.set_viewport = destination.aid.set_viewport, fail
+    with pytest.raises(RuntimeError):
+        destination.sync_to(source, aspects, skip_unchanged=True)
+
+    # retrying the same viewport is applied once the viewer recovers:
+    destination.aid.set_viewport = set_viewport
+    destination.sync_to(source, aspects, skip_unchanged=True)
+    assert destination.aid.n_set_viewport == 1
+
+
+def test_start_real_time_sync_filters_aspects():
+    source, destination = MockSyncAdapter(), MockSyncAdapter()
+    sync_manager = SyncManager()
+    sync_manager.start_real_time_sync(
+        source, destination, ["center", "center", "image_label"]
+    )
+    assert sync_manager.aspects == {"center"}
+
+
+def link_both_ways(delay_ms, lossy=False):
+    imviz, aladin = MockViewerSyncAdapter(lossy), MockViewerSyncAdapter(lossy)
+    managers = SyncManager(), SyncManager()
+    for manager in managers:
+        manager._delay_ms = delay_ms
+    managers[0].start_real_time_sync(imviz, aladin, SyncManager.ASPECTS)
+    managers[1].start_real_time_sync(aladin, imviz, SyncManager.ASPECTS)
+    return imviz, aladin
+
+
+@pytest.mark.parametrize("delay_ms", [0, 40])
+def test_reverse_sync_does_not_echo(delay_ms):
+    async def pan():
+        imviz, aladin = link_both_ways(delay_ms)
+        await asyncio.sleep(0.1)
+        n_imviz, n_aladin = imviz.aid.n_set_viewport, aladin.aid.n_set_viewport
+
+        new_center = SkyCoord(10, -30, unit="deg")
+        imviz.aid.pan(new_center)
+        await asyncio.sleep(0.1)
+        return imviz, aladin, n_imviz, n_aladin, new_center
+
+    imviz, aladin, n_imviz, n_aladin, new_center = asyncio.run(pan())
+
+    # the pan is synced to aladin once, and not synced back to imviz:
+    assert aladin.aid.n_set_viewport == n_aladin + 1
+    assert imviz.aid.n_set_viewport == n_imviz
+    assert aladin.aid.viewport["center"] is new_center
+
+
+@pytest.mark.parametrize("delay_ms", [0, 40])
+def test_inexact_reverse_sync_does_not_echo(delay_ms):
+    async def pan():
+        imviz, aladin = link_both_ways(delay_ms, lossy=True)
+        await asyncio.sleep(0.1)
+        n_imviz, n_aladin = imviz.aid.n_set_viewport, aladin.aid.n_set_viewport
+
+        imviz.aid.pan(SkyCoord(10, -30, unit="deg"))
+        await asyncio.sleep(0.2)
+        return imviz, aladin, n_imviz, n_aladin
+
+    imviz, aladin, n_imviz, n_aladin = asyncio.run(pan())
+
+    # aladin reports the pan back in galactic coordinates, rounded, and with
+    # a late fov update, which is still recognized as an echo of the sync:
+    assert aladin.aid.n_set_viewport == n_aladin + 1
+    assert imviz.aid.n_set_viewport == n_imviz
+    assert aladin.aid.viewport["center"].frame.name == "galactic"
+    assert aladin.aid.viewport["center"].separation(
+        imviz.aid.viewport["center"]
+    ) < 1 * u.arcsec
@@ -0,0 +1,42 @@
+import asyncio
+
+from mast_aladin.adapters.throttle import Throttler
+
+
+def test_throttler_without_event_loop_is_immediate():
+    calls = []
+    throttled = Throttler(calls.append)
+
+    throttled(1)
+    throttled(2)
+    assert calls == [1, 2]
+
+
+def test_throttler_uses_latest_arguments():
+    calls = []
+    throttled = Throttler(calls.append, interval=0.01)
+
+    async def pan():
+        for i in range(10):
+            throttled(i)
+        await asyncio.sleep(0.05)
+        throttled(10)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(pan())
+
+    assert calls == [9, 10]
+
+
+def test_throttler_cancel_drops_pending_call():
+    calls = []
+    throttled = Throttler(calls.append, interval=0.01)
+
+    async def pan_then_cancel():
+        throttled(1)
+        throttled.cancel()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(pan_then_cancel())
+
+    assert calls == []
@@ -0,0 +1,175 @@
+import asyncio
+import re
+from types import SimpleNamespace
+
+from traitlets import Float, HasTraits, Unicode
+
+from mast_aladin.adapters.viewport_outline import ViewportOutline
+
+
+class StubAladin(HasTraits):
+    """
+    Stands in for a rendered mast-aladin app, with the viewport traits
+    and overlay methods used by `ViewportOutline`.
+    """
+    _fov = Float(1.0)
+    _target = Unicode('0 0')
+
+    def __init__(self):
+        super().__init__()
+        self._wcs = {'CTYPE1': 'RA---TAN'}
+        self._overlays_dict = {}
+
+    def get_viewport_region(self):
+        return 'aladin viewport'
+
+    def add_graphic_overlay_from_region(self, region, name, **kwargs):
+        overlay = {'options': {'name': name, **kwargs}}
+        self._overlays_dict[name] = overlay
+        return overlay
+
+    def remove_overlay(self, overlays):
+        if isinstance(overlays, dict):
+            overlays = [overlays['options']['name']]
+        elif isinstance(overlays, str):
+            overlays = [overlays]
+        for name in overlays:
+            del self._overlays_dict[name]
+
+
+class StubGlueState:
+    """
+    Viewer state with echo-style callbacks.
+    """
+    def __init__(self):
+        self.callbacks = {}
+
+    def add_callback(self, name, callback):
+        self.callbacks.setdefault(name, []).append(callback)
+
+    def remove_callback(self, name, callback):
+        # like echo, fail on callbacks that were never added:
+        self.callbacks[name].remove(callback)
+
+    def fire(self, name):
+        for callback in list(self.callbacks.get(name, [])):
+            callback()
+
+
+class StubGlueViewer:
+    def __init__(self):
+        self.state = StubGlueState()
+        self.overlays = {}
+        self.n_drawn = 0
+
+    def _get_region_overlay_labels(self):
+        return list(self.overlays)
+
+    def _add_region_overlay(self, region, region_label, colors, stroke_width):
+        self.overlays[region_label] = dict(region=region, colors=colors)
+        self.n_drawn += 1
+
+    def _remove_region_overlay(self, labels):
+        for label in [labels] if isinstance(labels, str) else labels:
+            del self.overlays[label]
+
+
+class StubJdavizViewer:
+    def __init__(self):
+        self._obj = SimpleNamespace(glue_viewer=StubGlueViewer())
+        self.n_drawn_in_aladin = 0
+
+    def get_viewport_region(self):
+        self.n_drawn_in_aladin += 1
+        return 'jdaviz viewport'
+
+
+def stub_apps():
+    jdaviz_viewer = StubJdavizViewer()
+    return jdaviz_viewer, jdaviz_viewer._obj.glue_viewer, StubAladin()
+
+
+def outline_labels(aladin, glue_viewer):
+    return (
+        [name for name in aladin._overlays_dict if name.startswith('jdaviz @')],
+        [label for label in glue_viewer.overlays if label.startswith('mast-aladin @')],
+    )
+
+
+def test_viewport_callbacks_are_registered_once():
+    jdaviz_viewer, glue_viewer, aladin = stub_apps()
+    outline = ViewportOutline(jdaviz_viewer, aladin)
+
+    for _ in range(2):
+        outline.jdaviz_outline_in_aladin = False
+        outline.aladin_outline_in_jdaviz = False
+        assert glue_viewer.state.callbacks['x_min'] == []
+
+        outline.jdaviz_outline_in_aladin = True
+        outline.aladin_outline_in_jdaviz = True
+        assert len(glue_viewer.state.callbacks['x_min']) == 1
+
+    # each viewport change redraws its outline once, replacing the last one:
+    n_drawn = glue_viewer.n_drawn
+    aladin._fov = 2.0
+    assert glue_viewer.n_drawn == n_drawn + 1
+
+    n_drawn = jdaviz_viewer.n_drawn_in_aladin
+    glue_viewer.state.fire('x_min')
+    assert jdaviz_viewer.n_drawn_in_aladin == n_drawn + 1
+
+    assert [len(labels) for labels in outline_labels(aladin, glue_viewer)] == [1, 1]
+
+    outline.clear_all()
+
+    # nothing is left registered or drawn:
+    assert glue_viewer.state.callbacks['x_min'] == []
+    n_drawn = glue_viewer.n_drawn
+    aladin._fov = 3.0
+    aladin._target = '10 20'
+    assert glue_viewer.n_drawn == n_drawn
+    assert outline_labels(aladin, glue_viewer) == ([], [])
+
+
+def test_outline_labels_are_unique():
+    jdaviz_viewer, glue_viewer, aladin = stub_apps()
+
+    labels = []
+    for _ in range(2):
+        outline = ViewportOutline(jdaviz_viewer, aladin)
+        labels += [
+            outline.aladin_overlay['options']['name'],
+            outline.jdaviz_overlay['region_label'],
+        ]
+
+    assert len(set(labels)) == len(labels)
+    for label, app_name in zip(labels, ['jdaviz', 'mast-aladin'] * 2):
+        assert re.fullmatch(rf"{app_name} @ \d\d:\d\d:\d\d #\d+", label)
+
+    # only the latest instance's outlines are shown:
+    assert outline_labels(aladin, glue_viewer) == ([labels[2]], [labels[3]])
+
+
+def test_redraws_are_throttled():
+    jdaviz_viewer, glue_viewer, aladin = stub_apps()
+
+    async def pan():
+        outline = ViewportOutline(jdaviz_viewer, aladin)
+        n_drawn = glue_viewer.n_drawn, jdaviz_viewer.n_drawn_in_aladin
+
+        for i in range(10):
+            aladin._fov = 2.0 + i
+            glue_viewer.state.fire('x_min')
+        outline.outline_color = '#00ff00'
+        outline.outline_width = 2
+        await asyncio.sleep(0.1)
+
+        return n_drawn, outline
+
+    (n_drawn_in_jdaviz, n_drawn_in_aladin), outline = asyncio.run(pan())
+
+    # all the changes above are redrawn once in each app:
+    assert glue_viewer.n_drawn == n_drawn_in_jdaviz + 1
+    assert jdaviz_viewer.n_drawn_in_aladin == n_drawn_in_aladin + 1
+    (label,) = outline_labels(aladin, glue_viewer)[1]
+    assert glue_viewer.overlays[label]['colors'] == ['#00ff00']
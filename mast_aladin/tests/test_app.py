@@ -1,3 +1,7 @@
+import gc
+import weakref
+
+from mast_aladin import app as app_module
 from mast_aladin.app import MastAladin, gca
 
 
@@ -10,3 +14,40 @@ def test_current_app(MastAladin_app):
 
     # gca should refer to the newly instantiated app:
     assert gca() == instance2
+
+
+def test_current_app_is_live_instance():
+    app = MastAladin()
+
+    # gca returns the app itself, without creating a new one, and only
+    # holds a weak reference to it:
+    assert gca() is app
+    assert gca() is app
+    assert isinstance(app_module._latest_instantiated_app, weakref.ref)
+
+
+class StubApp:
+    """
+    Stands in for a `MastAladin` app, without a widget or comm which
+    might keep it alive.
+    """
+
+
+def test_current_app_is_not_kept_alive(monkeypatch):
+    new_apps = []
+
+    def new_app():
+        new_apps.append(StubApp())
+        return new_apps[-1]
+
+    monkeypatch.setattr(app_module, 'MastAladin', new_app)
+
+    app = StubApp()
+    monkeypatch.setattr(app_module, '_latest_instantiated_app', weakref.ref(app))
+    assert gca() is app
+    assert new_apps == []
+
+    # once the latest app is gone, gca creates a new one:
+    del app
+    gc.collect()
+    assert gca() is new_apps[0]
@@ -0,0 +1,209 @@
+import gc
+from types import SimpleNamespace
+import weakref
+
+import pytest
+
+from mast_aladin import app_sidecar
+from mast_aladin.app_sidecar import AppSidecarManager, set_app_height
+
+
+class StubApp:
+    """
+    An app which is neither a jdaviz app, an Aladin widget, nor a MastTable.
+    """
+    sidecar = None
+
+
+class StubSidecar:
+    """
+    Stands in for a ``sidecar.Sidecar``, recording what is displayed in it
+    and how many times it is closed.
+    """
+    # the sidecar whose context is currently entered:
+    entered = None
+
+    def __init__(self, anchor=None, title=None, ref=None):
+        self.anchor = anchor
+        self.title = title
+        self.ref = ref
+        self.n_closed = 0
+        self.contents = []
+
+    def __enter__(self):
+        StubSidecar.entered = self
+        return self
+
+    def __exit__(self, *exc_info):
+        StubSidecar.entered = None
+        return False
+
+    def close(self):
+        self.n_closed += 1
+
+
+@pytest.fixture
+def stub_sidecars(monkeypatch):
+    """
+    Replace sidecars and their contents with stubs, so no frontend is
+    needed. Returns the list of sidecars created.
+    """
+    sidecars = []
+
+    def new_sidecar(**kwargs):
+        sidecar = StubSidecar(**kwargs)
+        sidecars.append(sidecar)
+        return sidecar
+
+    def display(contents):
+        StubSidecar.entered.contents.append(contents)
+
+    monkeypatch.setattr(app_sidecar, 'UpstreamSidecar', new_sidecar)
+    monkeypatch.setattr(app_sidecar, 'SidecarContents', lambda **kwargs: kwargs)
+    monkeypatch.setattr(app_sidecar.solara, 'display', display)
+    return sidecars
+
+
+def test_kinds_are_not_kept_for_deleted_apps():
+    manager = AppSidecarManager()
+    app = StubApp()
+    assert manager._kind(app) == 'other'
+
+    ref = weakref.ref(app)
+    del app
+    gc.collect()
+
+    # the cached kind doesn't keep the app alive, and is dropped with it:
+    assert ref() is None
+    assert len(manager._kinds) == 0
+
+
+def test_apps_with_one_anchor_share_one_sidecar(stub_sidecars):
+    sidecars = stub_sidecars
+    apps = StubApp(), StubApp()
+
+    AppSidecarManager().open(*apps, anchor='split-right', height=300)
+
+    assert len(sidecars) == 1
+    assert all(app.sidecar is sidecars[0] for app in apps)
+    assert sidecars[0].contents == [dict(apps=apps, kinds=('other', 'other'), height=300)]
+
+
+def test_apps_with_two_anchors_get_a_sidecar_each(stub_sidecars):
+    sidecars = stub_sidecars
+    apps = StubApp(), StubApp()
+
+    AppSidecarManager().open(*apps, anchor=['split-right', 'tab-after'], height=300)
+
+    assert len(sidecars) == 2
+    assert [app.sidecar for app in apps] == sidecars
+    # each sidecar is placed relative to the previous one:
+    assert [sidecar.anchor for sidecar in sidecars] == ['split-right', 'tab-after']
+    assert sidecars[1].ref is sidecars[0]
+    assert [sidecar.contents for sidecar in sidecars] == [
+        [dict(apps=(apps[0],), kinds=('other',), height=300)],
+        [dict(apps=(apps[1],), kinds=('other',), height=300)],
+    ]
+
+
+def test_apps_opened_again_are_loaded_once(stub_sidecars):
+    manager = AppSidecarManager()
+    app, other_app = StubApp(), StubApp()
+
+    manager.open(app)
+    manager.open(app, other_app, close_existing=False)
+
+    assert manager.loaded_apps == [app, other_app]
+
+
+def test_jdaviz_is_only_imported_when_needed(stub_sidecars, monkeypatch):
+    def imviz_helper():
+        raise AssertionError("jdaviz was imported")
+
+    monkeypatch.setattr(app_sidecar, '_imviz_helper', imviz_helper)
+    monkeypatch.setattr(app_sidecar, 'gca', lambda: None)
+    monkeypatch.setattr(app_sidecar, 'MastAladin', StubApp)
+
+    manager = AppSidecarManager()
+    manager.open(include_aladin=True)
+    manager.open(StubApp(), include_jdaviz=False)
+
+
+def test_close_all_closes_each_sidecar_once(stub_sidecars):
+    sidecars = stub_sidecars
+    manager = AppSidecarManager()
+
+    # two apps share the first sidecar, the next two get a sidecar each:
+    manager.open(StubApp(), StubApp())
+    manager.open(StubApp(), StubApp(), anchor=['split-right', 'tab-after'],
+                 close_existing=False)
+    manager.close_all()
+
+    assert [sidecar.n_closed for sidecar in sidecars] == [1, 1, 1]
+    assert manager.loaded_apps == []
+
+
+class StubLayout:
+    """
+    Has a ``height`` like a widget or widget layout, counting how many
+    times it is assigned.
+    """
+    def __init__(self, height):
+        self._height = height
+        self.n_assigned = 0
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, height):
+        self._height = height
+        self.n_assigned += 1
+
+
+class StubNotebookSettings(dict):
+    """
+    Notebook settings of a jdaviz app, counting how many times they are
+    assigned.
+    """
+    n_assigned = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.n_assigned += 1
+
+
+def test_set_app_height_skips_unchanged_heights():
+    notebook_settings = StubNotebookSettings(max_height='300px')
+    jdaviz_app = SimpleNamespace(app=SimpleNamespace(
+        layout=StubLayout('300px'),
+        state=SimpleNamespace(settings={'context': {'notebook': notebook_settings}}),
+    ))
+    aladin_app = StubLayout(300)
+    table_app = SimpleNamespace(layout=StubLayout('300px'))
+
+    for _ in range(2):
+        set_app_height(jdaviz_app, 300, kind='jdaviz')
+        set_app_height(aladin_app, 300, kind='aladin')
+        set_app_height(table_app, 300, kind='table')
+
+    assert jdaviz_app.app.layout.n_assigned == 0
+    assert notebook_settings.n_assigned == 0
+    assert aladin_app.n_assigned == 0
+    assert table_app.layout.n_assigned == 0
+
+    for _ in range(2):
+        set_app_height(jdaviz_app, '100%', kind='jdaviz')
+        set_app_height(aladin_app, '100%', kind='aladin')
+        set_app_height(table_app, '100%', kind='table')
+
+    # each new height is only assigned once:
+    assert jdaviz_app.app.layout.height == '100%'
+    assert jdaviz_app.app.layout.n_assigned == 1
+    assert notebook_settings == {'max_height': '100%'}
+    assert notebook_settings.n_assigned == 1
+    assert aladin_app.height == -1
+    assert aladin_app.n_assigned == 1
+    assert table_app.layout.height == '100%'
+    assert table_app.layout.n_assigned == 1
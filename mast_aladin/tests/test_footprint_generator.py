@@ -0,0 +1,184 @@
+import copy
+
+from astropy.coordinates import Angle
+from astropy.table import Table
+import numpy as np
+import pytest
+
+from mast_aladin.utils.footprint_generator import (
+    DitherPattern,
+    Exposure,
+    Observation,
+    Program,
+    exp_list_to_table,
+    s_region,
+)
+from mast_aladin.utils.selectSIAF import (
+    computeStcsFootprint,
+    defineApertures,
+    getVertices,
+)
+
+
+TARGET_RA = Angle(210.8, 'deg')
+TARGET_DEC = Angle(54.35, 'deg')
+
+
+def small_program():
+    program = Program(1234)
+    obs = program.add_observation(Observation(30))
+    obs.add_pattern(DitherPattern(
+        Exposure(TARGET_RA, TARGET_DEC, telescope='jwst', instrument='nircam',
+                 aperture='NRCA1_FULL'),
+        num_rows=2, num_cols=2, row_x_offset=100, col_y_offset=120,
+    ))
+    obs = program.add_observation(Observation(210))
+    obs.add_exposure(Exposure(TARGET_RA, TARGET_DEC, y_off=500))
+    obs = program.add_observation(Observation())
+    obs.add_exposure(Exposure(TARGET_RA, TARGET_DEC, telescope='hst',
+                              instrument='ACS', aperture='JWFC'))
+    return program
+
+
+def test_parallel_exp_list_matches_sequential():
+    program = small_program()
+
+    sequential = program.get_exp_list(n_workers=1)
+    parallel = program.get_exp_list(n_workers=2)
+
+    assert len(sequential) == 4 + 18 + 1
+    assert parallel == sequential
+    assert [exp['s_region'] for exp in parallel] == [exp['s_region'] for exp in sequential]
+
+
+def test_jwst_nircam_s_region():
+    exp = Exposure(TARGET_RA, TARGET_DEC, x_off=10, y_off=-20, telescope='jwst',
+                   instrument='nircam', aperture='NRCA1_FULL')
+    (exp_dict,) = exp.get_exp_list(pa=30)
+
+    assert exp_dict['s_region'] == (
+        'POLYGON ICRS 210.79697697 54.33435233 210.77030948 54.34311923 '
+        '210.78554113 54.35860796 210.81181163 54.34992223 '
+    )
+    assert exp_dict['aper_ra'] == pytest.approx(210.79116425711513, abs=1e-10)
+    assert exp_dict['aper_dec'] == pytest.approx(54.34652754153318, abs=1e-10)
+
+
+def test_roman_wfi_s_region():
+    exp_list = Exposure(TARGET_RA, TARGET_DEC, x_off=10, y_off=-20).get_exp_list(pa=30)
+
+    # Roman WFI exposures are split into one exposure per detector
+    assert len(exp_list) == 18
+    assert [exp['aperture'] for exp in exp_list[:2]] == ['WFI01_FULL', 'WFI02_FULL']
+    assert exp_list[0]['s_region'] == (
+        'POLYGON ICRS 210.81483562 54.31885216 210.70908077 54.42530564 '
+        '210.52224282 54.36247402 210.62921447 54.25660873 '
+    )
+    assert exp_list[1]['s_region'] == (
+        'POLYGON ICRS 210.93815507 54.19300316 210.83530659 54.29724752 '
+        '210.64997780 54.23513025 210.75432525 54.13154964 '
+    )
+    assert exp_list[0]['aper_ra'] == pytest.approx(210.6690527728671, abs=1e-10)
+    assert exp_list[0]['aper_dec'] == pytest.approx(54.34054829396479, abs=1e-10)
+
+
+def test_hst_cos_s_region():
+    exp = Exposure(TARGET_RA, TARGET_DEC, telescope='hst', instrument='cos', aperture='all')
+    (exp_dict,) = exp.get_exp_list(pa=210)
+
+    # circle centers are written at full precision:
+    assert exp_dict['s_region'] == 4 * (
+        'CIRCLE ICRS 210.88079165943947 54.42949155700168 0.011666666666666667 '
+    )
+
+
+def test_s_region_matches_per_aperture_transforms():
+    exp = Exposure(TARGET_RA, TARGET_DEC, x_off=5, y_off=7, telescope='hst',
+                   instrument='all', aperture='all')
+    att_matrix = exp.pointing.attitude_matrix(33)
+
+    # transform each aperture on its own, as the footprints were first computed:
+    expected = ''
+    for ap in copy.deepcopy(exp.aperture_list):
+        ap.set_attitude_matrix(att_matrix)
+        xVertices, yVertices = getVertices(ap)
+        if xVertices is not None and yVertices is not None:
+            expected += computeStcsFootprint(ap, *ap.idl_to_sky(xVertices, yVertices))
+
+    assert 'CIRCLE' in expected and 'POLYGON' in expected
+    assert s_region(exp.aperture_list, att_matrix) == expected
+
+
+def test_shared_apertures_give_each_exposure_its_own_s_region():
+    exp_a = Exposure(TARGET_RA, TARGET_DEC, telescope='jwst', instrument='nircam',
+                     aperture='NRCALL_FULL')
+    exp_b = Exposure(Angle(10.5, 'deg'), Angle(-30.2, 'deg'), x_off=50,
+                     telescope='jwst', instrument='nircam', aperture='NRCALL_FULL')
+    # both exposures use the same cached aperture objects
+    assert all(ap_a is ap_b for ap_a, ap_b in zip(exp_a.aperture_list, exp_b.aperture_list))
+
+    def expected(exp, pa):
+        # footprint computed with apertures of its own
+        att_matrix = exp.pointing.attitude_matrix(pa)
+        return s_region(copy.deepcopy(exp.aperture_list), att_matrix)
+
+    expected_a = expected(exp_a, 20)
+    expected_b = expected(exp_b, 75)
+    assert expected_a != expected_b
+
+    for exp, pa, expected_s_region in [
+        (exp_a, 20, expected_a),
+        (exp_b, 75, expected_b),
+        (exp_a, 20, expected_a),
+    ]:
+        (exp_dict,) = exp.get_exp_list(pa=pa)
+        assert exp_dict['s_region'] == expected_s_region
+
+
+def test_aperture_lists_are_not_shared():
+    exp_a = Exposure(TARGET_RA, TARGET_DEC, telescope='jwst', instrument='nircam',
+                     aperture='NRCALL_FULL')
+    exp_b = Exposure(Angle(10.5, 'deg'), Angle(-30.2, 'deg'), telescope='jwst',
+                     instrument='nircam', aperture='NRCALL_FULL')
+    aperture_names = [ap.AperName for ap in exp_b.aperture_list]
+
+    exp_a.aperture_list.reverse()
+    exp_a.aperture_list.pop()
+
+    assert [ap.AperName for ap in exp_b.aperture_list] == aperture_names
+    cached_list = defineApertures('jwst', 'nircam', 'NRCALL_FULL')[0]
+    assert [ap.AperName for ap in cached_list] == aperture_names
+    assert [
+        ap.AperName for ap in Exposure(TARGET_RA, TARGET_DEC, telescope='jwst',
+                                       instrument='nircam',
+                                       aperture='NRCALL_FULL').aperture_list
+    ] == aperture_names
+
+
+EXP_TABLE_COLUMNS = [
+    'telescope', 'instrument', 'aperture', 'targ_ra', 'targ_dec', 'aper_ra',
+    'aper_dec', 'program_num', 'obs_num', 'position_angle', 'exp_num', 'x_off',
+    'y_off', 'pattern_point', 's_region',
+]
+
+
+def assert_tables_equal(table, expected):
+    assert table.colnames == expected.colnames
+    assert len(table) == len(expected)
+    for name in expected.colnames:
+        assert table[name].dtype == expected[name].dtype
+        np.testing.assert_array_equal(table[name], expected[name])
+
+
+@pytest.mark.parametrize('exp_list', [
+    lambda: small_program().get_exp_list(),
+    lambda: [],
+], ids=['program', 'empty'])
+def test_exp_list_to_table_matches_row_by_row_table(exp_list):
+    exp_list = exp_list()
+    table = exp_list_to_table(exp_list)
+
+    # the table astropy builds from the exposure dicts one row at a time
+    expected = Table(rows=exp_list, names=EXP_TABLE_COLUMNS)
+
+    assert_tables_equal(table, expected)
@@ -1,5 +1,9 @@
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 
+import numpy as np
 from astropy.table import Table
 from pysiaf.utils.rotations import attitude_matrix
 from mast_aladin.utils.selectSIAF import (
@@ -32,18 +36,68 @@ def s_region(apertures, att_matrix):
         - Apertures without vertices (e.g., HST/FGS PICK) are skipped.
         - Each aperture's footprint is appended to the combined result.
     """
-    combined_s_region = ''
+    return ''.join(_aperture_s_regions(apertures, att_matrix))
 
-    for ap in apertures:
-        ap.set_attitude_matrix(att_matrix)
+
+def _aperture_s_regions(apertures, att_matrix):
+    """
+    Return the STCS region string of each aperture in ``apertures``
+    with the attitude matrix ``att_matrix`` applied, or an empty string
+    for apertures without vertices. See `s_region`.
+    """
+    ap_s_regions = [''] * len(apertures)
+    footprint_apertures = []
+    telV2, telV3 = [], []
+    for i, ap in enumerate(apertures):
+        _set_attitude_matrix(ap, att_matrix)
         xVertices, yVertices = getVertices(ap)
 
         # Skip PICK (pickle) which do not have vertices
-        if (xVertices is not None and yVertices is not None):
-            skyRa, skyDec = ap.idl_to_sky(xVertices, yVertices)
-            ap_s_region = computeStcsFootprint(ap, skyRa, skyDec)
-            combined_s_region += ap_s_region
-    return combined_s_region
+        if (xVertices is None or yVertices is None):
+            continue
+
+        if np.ndim(xVertices) == 0:
+            # CIRC apertures have a single (scalar) vertex at their center,
+            # which is written to the s_region at full precision, so
+            # transform it on its own to keep the same digits:
+            apRa, apDec = ap.idl_to_sky(xVertices, yVertices)
+            ap_s_regions[i] = computeStcsFootprint(ap, apRa, apDec)
+            continue
+
+        apV2, apV3 = ap.idl_to_tel(xVertices, yVertices)
+        footprint_apertures.append((i, ap, np.size(apV2)))
+        telV2.append(apV2)
+        telV3.append(apV3)
+
+    if not footprint_apertures:
+        return ap_s_regions
+
+    # The telescope to sky transformation depends only on the attitude
+    # matrix, so transform the vertices of all polygon apertures in one
+    # call. Their s_regions are rounded to 8 decimals, far coarser than
+    # the last digit differences this may cause.
+    skyRa, skyDec = footprint_apertures[0][1].tel_to_sky(
+        np.concatenate(telV2), np.concatenate(telV3)
+    )
+
+    start = 0
+    for i, ap, n_vertices in footprint_apertures:
+        apRa, apDec = skyRa[start:start + n_vertices], skyDec[start:start + n_vertices]
+        start += n_vertices
+
+        ap_s_regions[i] = computeStcsFootprint(ap, apRa, apDec)
+    return ap_s_regions
+
+
+def _set_attitude_matrix(ap, att_matrix):
+    """
+    Set the attitude matrix of the aperture ``ap``, unless it is already
+    set to this matrix. Pointing caches its attitude matrices, so the same
+    matrix object is applied again for every exposure at a pointing and
+    position angle, and pysiaf validates every attribute assignment.
+    """
+    if getattr(ap, '_attitude_matrix', None) is not att_matrix:
+        ap.set_attitude_matrix(att_matrix)
 
 
 def exp_list_to_table(exp_list):
@@ -93,6 +147,11 @@ def exp_list_to_table(exp_list):
         'pattern_point',
         's_region',
     ]
+    if len(exp_list) and isinstance(exp_list[0], dict):
+        # Gather each column in one pass rather than having the Table
+        # convert the exposure dicts row by row.
+        exp_list = [[exp[name] for exp in exp_list] for name in names]
+
     table = Table(names=names, data=exp_list)
     return table
 
@@ -100,6 +159,8 @@ def exp_list_to_table(exp_list):
 class ExpResultGenerator(ABC):
     """
     """
+    __slots__ = ()
+
     @abstractmethod
     def get_exp_list(
         self,
@@ -119,6 +180,7 @@ class Pointing:
     be placed on that target. It is independent of position angle which is the
     angle from North to East measured at a particular V2/V3.
     """
+    __slots__ = ('_v2', '_v3', '_ra', '_dec', '_x_off', '_y_off', '_att_matrices')
 
     @property
     def v2(self):
@@ -172,12 +234,28 @@ class Pointing:
         self._x_off = x_off
         self._y_off = y_off
 
+        # Attitude matrices by position angle. A Pointing can't be changed,
+        # so each matrix only needs to be computed once.
+        self._att_matrices = {}
+
     def attitude_matrix(self, pa=0):
-        att_matrix = attitude_matrix(self.v2, self.v3, self.ra, self.dec, pa)
+        att_matrix = self._att_matrices.get(pa)
+        if att_matrix is None:
+            att_matrix = attitude_matrix(self.v2, self.v3, self.ra, self.dec, pa)
+            # The matrix is shared by every caller, so guard it from changes.
+            att_matrix.flags.writeable = False
+            self._att_matrices[pa] = att_matrix
         return att_matrix
 
 
 class Exposure(ExpResultGenerator):
+    __slots__ = (
+        '_target_ra', '_target_dec', '_x_off', '_y_off',
+        '_telescope', '_instrument', '_aperture',
+        '_aperture_list', '_aperture_v2_refs', '_aperture_v3_refs',
+        '_ref_aperture_siaf', '_ref_aper_v2_ref', '_ref_aper_v3_ref',
+        '_V2Ref', '_V3Ref', '_pointing', '_static_exp_fields',
+    )
 
     @property
     def telescope(self):
@@ -225,14 +303,17 @@ class Exposure(ExpResultGenerator):
 
     @property
     def pointing(self):
-        return Pointing(
-            self.V2Ref,
-            self.V3Ref,
-            self.target_ra,
-            self.target_dec,
-            x_off=self.x_off,
-            y_off=self.y_off,
-        )
+        # Reuse one Pointing so its attitude matrices are only computed once.
+        if self._pointing is None:
+            self._pointing = Pointing(
+                self.V2Ref,
+                self.V3Ref,
+                self.target_ra,
+                self.target_dec,
+                x_off=self.x_off,
+                y_off=self.y_off,
+            )
+        return self._pointing
 
     def __init__(self, target_ra, target_dec, x_off=0, y_off=0,
                  telescope='roman', instrument='WFI', aperture='ALL'):
@@ -277,14 +358,23 @@ class Exposure(ExpResultGenerator):
         self._aperture = aperture
 
         (
-            self._aperture_list,
+            aperture_list,
             aper_v2_ref,
             aper_v3_ref,
             self._ref_aperture_siaf,
         ) = defineApertures(telescope, instrument, aperture)
+        # defineApertures caches its results, so keep a list of our own.
+        # The apertures themselves are shared, which is safe since their
+        # attitude matrix is always set before it is used.
+        self._aperture_list = list(aperture_list)
+        # Reference points of each aperture, for transforming them together.
+        self._aperture_v2_refs = np.array([ap.V2Ref for ap in aperture_list])
+        self._aperture_v3_refs = np.array([ap.V3Ref for ap in aperture_list])
 
         self._ref_aper_v2_ref = aper_v2_ref
         self._ref_aper_v3_ref = aper_v3_ref
+        self._pointing = None
+        self._static_exp_fields = None
 
         if self._ref_aperture_siaf is None:
             # If the reference aperture doesn't exist (e.g., when
@@ -345,8 +435,16 @@ class Exposure(ExpResultGenerator):
             and self.instrument.lower() == 'wfi'
             and self.aperture.lower() == 'all'
         ):
-            # Separate the 18 detectors into separate "exposures".
-            for ap in self.aperture_list:
+            # Separate the 18 detectors into separate "exposures". Compute
+            # the footprints and reference points of all detectors at once.
+            ap_s_regions = _aperture_s_regions(self.aperture_list, att_matrix)
+            aper_ras, aper_decs = self.aperture_list[0].tel_to_sky(
+                self._aperture_v2_refs, self._aperture_v3_refs
+            )
+
+            for ap, ap_s_region, aper_ra, aper_dec in zip(
+                self.aperture_list, ap_s_regions, aper_ras, aper_decs
+            ):
                 exp = self._base_exp_obj(
                     pa,
                     program_num,
@@ -357,8 +455,7 @@ class Exposure(ExpResultGenerator):
                     pointing.y_off,
                 )
                 exp['aperture'] = ap.AperName
-                exp['s_region'] = s_region([ap], att_matrix)
-                aper_ra, aper_dec = ap.tel_to_sky(ap.V2Ref, ap.V3Ref)
+                exp['s_region'] = ap_s_region
                 exp['aper_ra'] = aper_ra
                 exp['aper_dec'] = aper_dec
                 exp_list.append(exp)
@@ -393,14 +490,23 @@ class Exposure(ExpResultGenerator):
         y_off=0,
     ) -> list:
 
+        if self._static_exp_fields is None:
+            # These fields are the same for every exposure, so only convert
+            # the target coordinates to degrees once.
+            targ_ra = self.target_ra.degree
+            targ_dec = self.target_dec.degree
+            self._static_exp_fields = {
+                'telescope': self.telescope,
+                'instrument': self.instrument,
+                'aperture': self.aperture,
+                'targ_ra': targ_ra,
+                'targ_dec': targ_dec,
+                'aper_ra': targ_ra,
+                'aper_dec': targ_dec,
+            }
+
         base_exp_obj = {
-            'telescope': self.telescope,
-            'instrument': self.instrument,
-            'aperture': self.aperture,
-            'targ_ra': self.target_ra.degree,
-            'targ_dec': self.target_dec.degree,
-            'aper_ra': self.target_ra.degree,
-            'aper_dec': self.target_dec.degree,
+            **self._static_exp_fields,
             'program_num': program_num,
             'obs_num': obs_num,
             'position_angle': pa,
@@ -415,6 +521,7 @@ class Exposure(ExpResultGenerator):
 
 
 class Pattern(ExpResultGenerator):
+    __slots__ = ('_exposure', '_pointings')
 
     @property
     def exposure(self):
@@ -464,18 +571,54 @@ class Pattern(ExpResultGenerator):
             list: A list of exposure dictionaries, each containing exposure metadata
                 (aperture, s_region, aper_ra, aper_dec, etc.) and observation parameters.
         """
-        exp_list = []
-        for p in self.pointings:
-            sub_list = self.exposure.get_exp_list(
-                pa, program_num, obs_num, exp_num, pattern_point, p
+        return list(chain.from_iterable(
+            self.exposure.get_exp_list(pa, program_num, obs_num, exp_num, point, p)
+            for point, p in enumerate(self.pointings, start=pattern_point)
+        ))
+
+    def _offset_pointings(self, total_x_offs, total_y_offs):
+        """
+        Create a Pointing for each pair of ideal detector coordinate
+        offsets, converting all of the offsets to V2/V3 in a single call.
+        """
+        if not len(total_x_offs):
+            return []
+
+        V2Ref_arcsec = self.exposure.V2Ref
+        V3Ref_arcsec = self.exposure.V3Ref
+        # Exposure already falls back to its first aperture if there is no
+        # reference aperture, so this is never None.
+        ref_aperture_siaf = self.exposure.ref_aperture_siaf
+        ra = self.exposure.target_ra
+        dec = self.exposure.target_dec
+
+        # Negate the offsets since they will define ideal coords on
+        # which to place the target, but the user is picturing moving
+        # the aperture in the direction of the ideal axes.
+        offset_v2s, offset_v3s = ref_aperture_siaf.idl_to_tel(
+            -np.asarray(total_x_offs),
+            -np.asarray(total_y_offs),
+            V2Ref_arcsec=V2Ref_arcsec,
+            V3Ref_arcsec=V3Ref_arcsec
             )
-            exp_list.extend(sub_list)
-            pattern_point += 1
 
-        return exp_list
+        return [
+            Pointing(
+                offset_v2,
+                offset_v3,
+                ra,
+                dec,
+                x_off=total_x_off,
+                y_off=total_y_off
+                )
+            for offset_v2, offset_v3, total_x_off, total_y_off in zip(
+                offset_v2s, offset_v3s, total_x_offs, total_y_offs
+            )
+        ]
 
 
 class CustomPattern(Pattern):
+    __slots__ = ('_offsets',)
 
     def __init__(self, exposure, offsets):
         """
@@ -498,42 +641,17 @@ class CustomPattern(Pattern):
         return self._offsets
 
     def _generate_pointings(self):
-        pointings = []
-        V2Ref_arcsec = self.exposure.V2Ref
-        V3Ref_arcsec = self.exposure.V3Ref
-        ref_aperture_siaf = self.exposure.ref_aperture_siaf
+        total_x_offs = [offset[0] for offset in self.offsets]
+        total_y_offs = [offset[1] for offset in self.offsets]
 
-        ra = self.exposure.target_ra
-        dec = self.exposure.target_dec
-
-        for offset in self.offsets:
-            total_x_off = offset[0]
-            total_y_off = offset[1]
-
-            # Negate the offsets since they will define ideal coords on
-            # which to place the target, but the user is picturing moving
-            # the aperture in the direction of the ideal axes.
-            offset_v2, offset_v3 = ref_aperture_siaf.idl_to_tel(
-                -total_x_off,
-                -total_y_off,
-                V2Ref_arcsec=V2Ref_arcsec,
-                V3Ref_arcsec=V3Ref_arcsec
-                )
-
-            pointing = Pointing(
-                offset_v2,
-                offset_v3,
-                ra,
-                dec,
-                x_off=total_x_off,
-                y_off=total_y_off
-                )
-            pointings.append(pointing)
-
-        return pointings
+        return self._offset_pointings(total_x_offs, total_y_offs)
 
 
 class DitherPattern(Pattern):
+    __slots__ = (
+        '_num_rows', '_num_cols',
+        '_row_x_off', '_row_y_off', '_col_x_off', '_col_y_off',
+    )
 
     def __init__(
         self,
@@ -604,52 +722,25 @@ class DitherPattern(Pattern):
         return self._col_y_off
 
     def _generate_pointings(self):
-        pointings = []
-        V2Ref_arcsec = self.exposure.V2Ref
-        V3Ref_arcsec = self.exposure.V3Ref
-        ref_aperture_siaf = self.exposure.ref_aperture_siaf
-        if ref_aperture_siaf is None:
-            # If the reference aperture doesn't exist (e.g., when
-            # pseudoaperture jwst fgs all was selected), use the first
-            # aperture object in the list to try the offset calculation.
-            ref_aperture_siaf = self.exposure.aperture_list[0]
-        ra = self.exposure.target_ra
-        dec = self.exposure.target_dec
-
-        for col in range(0, self._num_cols):
-            col_x_off = col * self._col_x_off
-            col_y_off = col * self._col_y_off
-            for row in range(0, self._num_rows):
-                row_x_off = row * self._row_x_off
-                row_y_off = row * self._row_y_off
-                total_x_off = col_x_off + row_x_off
-                total_y_off = col_y_off + row_y_off
-
-                # Negate the offsets since they will define ideal coords on
-                # which to place the target, but the user is picturing moving
-                # the aperture in the direction of the ideal axes.
-                offset_v2, offset_v3 = ref_aperture_siaf.idl_to_tel(
-                    -total_x_off,
-                    -total_y_off,
-                    V2Ref_arcsec=V2Ref_arcsec,
-                    V3Ref_arcsec=V3Ref_arcsec
-                    )
-
-                pointing = Pointing(
-                    offset_v2,
-                    offset_v3,
-                    ra,
-                    dec,
-                    x_off=total_x_off,
-                    y_off=total_y_off
-                    )
-
-                pointings.append(pointing)
-
-        return pointings
+        # Grid points go row by row within each column.
+        grid = [
+            (col, row)
+            for col in range(0, self._num_cols)
+            for row in range(0, self._num_rows)
+        ]
+        total_x_offs = [
+            col * self._col_x_off + row * self._row_x_off for col, row in grid
+        ]
+        total_y_offs = [
+            col * self._col_y_off + row * self._row_y_off for col, row in grid
+        ]
+
+        return self._offset_pointings(total_x_offs, total_y_offs)
 
 
 class Observation(ExpResultGenerator):
+    __slots__ = ('_pa', '_contents')
+
     @property
     def pa(self):
         return self._pa
@@ -730,18 +821,18 @@ class Observation(ExpResultGenerator):
             list: A list of exposure dictionaries, each containing exposure metadata
                 (aperture, s_region, aper_ra, aper_dec, etc.) and observation parameters.
         """
-        exp_list = []
         if pa is None:
             pa = self.pa
-        for c in self.contents:
-            sub_list = c.get_exp_list(pa=pa, program_num=program_num, obs_num=obs_num)
-            exp_list.extend(sub_list)
-            exp_num += 1
 
-        return exp_list
+        return list(chain.from_iterable(
+            c.get_exp_list(pa=pa, program_num=program_num, obs_num=obs_num)
+            for c in self.contents
+        ))
 
 
 class Program(ExpResultGenerator):
+    __slots__ = ('_program_num', '_contents')
+
     @property
     def program_num(self):
         return self._program_num
@@ -785,6 +876,7 @@ class Program(ExpResultGenerator):
         exp_num=0,
         pattern_point=0,
         pointing=None,
+        n_workers=1,
     ) -> list:
         """
         Generate a list of exposure dictionaries for this program. Delegate
@@ -795,14 +887,38 @@ class Program(ExpResultGenerator):
         the contained observations, although a non-zero obs_num can be
         specified as the starting number for contained observations.
 
+        Args:
+            n_workers (int or None, optional): Number of processes used to
+                compute the observations' exposures in parallel. If None,
+                use one per CPU. Starting processes has a cost, so this
+                helps only for programs with many observations. Defaults
+                to 1, which computes them in this process.
+
         Returns:
             list: A list of exposure dictionaries, each containing exposure metadata
                 (aperture, s_region, aper_ra, aper_dec, etc.) and observation parameters.
         """
-        exp_list = []
-        for c in self.contents:
-            sub_list = c.get_exp_list(program_num=self.program_num, obs_num=obs_num)
-            exp_list.extend(sub_list)
-            obs_num += 1
+        obs_nums = range(obs_num, obs_num + len(self.contents))
+        program_nums = [self.program_num] * len(self.contents)
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        if n_workers == 1 or len(self.contents) < 2:
+            sub_lists = map(_observation_exp_list, self.contents, program_nums, obs_nums)
+            return list(chain.from_iterable(sub_lists))
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            sub_lists = executor.map(
+                _observation_exp_list,
+                self.contents,
+                program_nums,
+                obs_nums,
+                chunksize=max(1, len(self.contents) // (4 * n_workers)),
+            )
+            return list(chain.from_iterable(sub_lists))
 
-        return exp_list
+
+def _observation_exp_list(observation, program_num, obs_num):
+    # Module level, so that it can be run in worker processes.
+    return observation.get_exp_list(program_num=program_num, obs_num=obs_num)
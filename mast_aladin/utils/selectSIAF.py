@@ -8,14 +8,20 @@
 ###############################################################
 # Imports
 
+from functools import lru_cache
+
 import numpy as np
 import pysiaf
 from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion, PolygonSkyRegion
 ###############################################################
 # Take user input to create list of aperture siaf info and v2,v3 reference points
+# Loading a SIAF is slow, so the apertures for each selection are cached. The
+# returned list and apertures are shared between calls: copy the list before
+# changing it.
 
 
+@lru_cache(maxsize=64)
 def defineApertures(selectedTelescope, selectedInstrument, selectedAperture):
 
     # Create lists of individual apertures that make up selected